@@ -219,7 +219,7 @@ class AvailabilityBuilder:
     ) -> None:
         residents = [self._get_resident(name) for name in resident_names]
         start_date = date.fromisoformat(start)
-        index = self._get_index(start_date) + days_until_next_weekday(
+        start_index = self._get_index(start_date) + days_until_next_weekday(
             start_date, Weekday.TUESDAY
         )
         end_date = date.fromisoformat(end)
@@ -229,21 +229,19 @@ class AvailabilityBuilder:
         else:
             omit_indices = []
 
-        while index < end_index and index < self.num_days:
+        for index in range(start_index, min(end_index, self.num_days), 7):
             self._set_unavailable_for_va(residents, index, omit_indices)
             if index + 1 < end_index:
                 self._set_unavailable_for_va(residents, index + 1, omit_indices)
                 if index + 2 < end_index:
                     self._set_unavailable_for_va(residents, index + 2, omit_indices)
-            index += 7
 
         if not omit_sundays:
-            index = self._get_index(start_date) + days_until_next_weekday(
+            start_index = self._get_index(start_date) + days_until_next_weekday(
                 start_date, Weekday.SUNDAY
             )
-            while index < end_index and index < self.num_days:
+            for index in range(start_index, min(end_index, self.num_days), 7):
                 self._set_unavailable_for_va(residents, index, omit_indices)
-                index += 7
 
     def _eliminate_non_preferred(self) -> None:
         for index in range(self.num_days):
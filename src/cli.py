@@ -1,6 +1,5 @@
 from typing import Sequence
 
-import json
 from datetime import timedelta
 import argparse
 
@@ -172,9 +171,7 @@ def main() -> None:
     availability = availability_or_errors
     """
 
-    with open(args.project, "r") as project_file:
-        project_data = json.loads(project_file.read())
-        project = Project.deserialize(project_data)
+    project = Project.read_from_file(args.project)
 
     if args.output == OutputMode.INTERACTIVE:
         print_availability(project.availability)
@@ -1,5 +1,6 @@
 from datetime import date, timedelta
 from enum import IntEnum
+from functools import lru_cache
 
 
 # Follows ISO something
@@ -31,6 +32,12 @@ def days_until_next_weekday(start: date, weekday: Weekday) -> int:
     return (7 + weekday - start.weekday()) % 7
 
 
+# The indices of every day in the time period that falls on the given day of the week
+@lru_cache(maxsize=256)
+def weekday_indices(start: date, num_days: int, weekday: Weekday) -> tuple[int, ...]:
+    return tuple(range(days_until_next_weekday(start, weekday), num_days, 7))
+
+
 # The number of days between the given start date and the previous given day of the week
 def days_after_last_weekday(start: date, weekday: Weekday) -> int:
     return (start.weekday() + 7 - weekday - 1) % 7
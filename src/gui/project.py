@@ -1,3 +1,5 @@
+import os
+import json
 from pathlib import Path
 from typing import override
 from functools import partial
@@ -18,7 +20,13 @@ from optimization.constraint import ConstraintRegistry
 from optimization.objective import ObjectiveRegistry
 from dateutil import Weekday
 from typeutil import none_throws
-from gui.table import TableWidget, SectionHeaderWidget, AddOrEditWidget, AddNewWidget
+from gui.table import (
+    TableWidget,
+    SectionHeaderWidget,
+    AddOrEditWidget,
+    AddNewWidget,
+    row_button,
+)
 from gui.availability import AvailabilityWidget
 from gui.common import center_on_screen, ProjectManagerWidget
 
@@ -213,15 +221,11 @@ class ObjectivesWidget(TableWidget):
             self.setRow(
                 i, objective.description(), objective.fields(self.project) != ()
             )
-            up_button = QtWidgets.QPushButton("↑")
-            up_button.setFixedHeight(40)
-            up_button.clicked.connect(partial(self.up_clicked, index=i))
+            up_button = row_button("↑", partial(self.up_clicked, index=i))
             if i == 0:
                 up_button.setEnabled(False)
             self.setCellWidget(i, self.col_offset + 3, up_button)
-            down_button = QtWidgets.QPushButton("↓")
-            down_button.setFixedHeight(40)
-            down_button.clicked.connect(partial(self.down_clicked, index=i))
+            down_button = row_button("↓", partial(self.down_clicked, index=i))
             if i == len(project.objectives) - 1:
                 down_button.setEnabled(False)
             self.setCellWidget(i, self.col_offset + 4, down_button)
@@ -261,7 +265,7 @@ class SolveThread(QtCore.QThread):
         super().__init__(parent)
 
         self.project = project
-        self.result: Solution | str | None = None
+        self.threads = os.cpu_count()
 
     @override
     def run(self) -> None:
@@ -269,7 +273,8 @@ class SolveThread(QtCore.QThread):
         builder.apply_constraints([AvailabilityConstraint()])
         builder.apply_constraints(self.project.constraints)
         builder.set_objectives(self.project.objectives)
-        result = self._get_solve_result(builder.solve())
+        solution = builder.solve(self.threads)
+        result = self._get_solve_result(solution)
         self.done_signal.emit(result)
 
     def _get_solve_result(self, result: Solution | str) -> SolveResult:
@@ -281,7 +286,7 @@ class SolveThread(QtCore.QThread):
             debug_builder = CallProblemBuilderImpl(self.project)
             debug_builder.apply_constraints(self.project.constraints)
             debug_builder.set_objectives([AvailabilityObjective()])
-            debug_result = debug_builder.solve()
+            debug_result = debug_builder.solve(self.threads)
             if isinstance(debug_result, Solution):
                 violations = debug_result.get_availability_violations()
                 if violations == []:
@@ -445,7 +450,7 @@ class ResultDetail(QtWidgets.QTableWidget):
         assignments = solution.get_assignments()
         metric_vals = [m.detail_metric(assignments) for m in metrics]
         for i, assigned in enumerate(assignments):
-            assignment_widget = QtWidgets.QLabel(", ".join(sorted(assigned)))
+            assignment_widget = QtWidgets.QLabel(", ".join(assigned))
             if (i >= 2 and assignments[i - 2] == assigned) or (
                 i < len(assignments) - 2 and assignments[i + 2] == assigned
             ):
@@ -537,6 +542,17 @@ class EditProjectWidget(ProjectManagerWidget):
 
         self.generate_button = QtWidgets.QPushButton("Generate schedule")
 
+        # Loading and failure pages are kept around and swapped in, only the
+        # schedule page is rebuilt for each new solution
+        self.result_stack = QtWidgets.QStackedWidget()
+        self.loading_label = QtWidgets.QLabel("Loading...")
+        self.result_stack.addWidget(self.loading_label)
+        self.failed_label = QtWidgets.QLabel()
+        self.result_stack.addWidget(self.failed_label)
+        self.schedule_result: ScheduleResult | None = None
+        # Nothing to show until the first generate
+        self.result_stack.hide()
+
         self._layout = QtWidgets.QGridLayout(self)
         self._layout.addWidget(availability_button, 0, 0, 1, 2)
         self._layout.addWidget(self.constraints_header, 1, 0)
@@ -544,11 +560,15 @@ class EditProjectWidget(ProjectManagerWidget):
         self._layout.addWidget(self.objectives_header, 1, 1)
         self._layout.addWidget(self.objectives, 2, 1)
         self._layout.addWidget(self.generate_button, 3, 0, 1, 2)
+        self._layout.addWidget(self.result_stack, 4, 0, 1, 2)
 
         availability_button.clicked.connect(self.edit_availability_clicked)
         self.generate_button.clicked.connect(self.generate_clicked)
 
-        self.result = None
+        # Serialized project and its solution from the last successful solve,
+        # so regenerating an unchanged project doesn't re-run the solver
+        self._last_solve: tuple[str, Solution] | None = None
+        self._solving_key: str | None = None
 
     def every_second(self) -> None:
         saved_ago = (datetime.now() - self.last_saved).total_seconds()
@@ -586,20 +606,38 @@ class EditProjectWidget(ProjectManagerWidget):
         center_on_screen(self.availability)
         self.setEnabled(False)
 
-    def _set_result(self, new_result: QtWidgets.QWidget) -> None:
-        if self.result is None:
-            self.result = new_result
-            self._layout.addWidget(self.result, 4, 0, 1, 2)
-        else:
-            old_result = self.result
-            self.result = new_result
-            old = self._layout.replaceWidget(old_result, self.result)
-            old.widget().deleteLater()
+    def _show_result_page(self, page: QtWidgets.QWidget) -> None:
+        self.result_stack.setCurrentWidget(page)
+        self.result_stack.show()
+
+    def _show_loading(self) -> None:
+        self._show_result_page(self.loading_label)
+
+    def _show_failed(self, message: str) -> None:
+        self.failed_label.setText(message)
+        self._show_result_page(self.failed_label)
+
+    def _show_schedule(self, schedule: ScheduleResult) -> None:
+        if self.schedule_result is not None:
+            self.result_stack.removeWidget(self.schedule_result)
+            self.schedule_result.deleteLater()
+        self.schedule_result = schedule
+        self.result_stack.addWidget(schedule)
+        self._show_result_page(schedule)
+
+    def _solve_key(self) -> str:
+        return json.dumps(self.project.serialize(), sort_keys=True)
 
     @QtCore.Slot()
     def generate_clicked(self) -> None:
+        key = self._solve_key()
+        if self._last_solve is not None and self._last_solve[0] == key:
+            self._show_schedule(ScheduleResult(self.project, self._last_solve[1]))
+            return
+
         self.generate_button.setEnabled(False)
-        self._set_result(QtWidgets.QLabel("Loading..."))
+        self._show_loading()
+        self._solving_key = key
         solver = SolveThread(self.project, self)
         solver.done_signal.connect(self.result_ready)
         solver.start()
@@ -608,8 +646,11 @@ class EditProjectWidget(ProjectManagerWidget):
     def result_ready(self, result: SolveResult) -> None:
         self.generate_button.setEnabled(True)
         if isinstance(result.result, str):
-            self._set_result(QtWidgets.QLabel(result.result))
+            self._show_failed(result.result)
             print("Failed:")
             print(result.result)
         else:
-            self._set_result(ScheduleResult(self.project, result.result))
+            if self._solving_key is not None:
+                self._last_solve = (self._solving_key, result.result)
+            self._show_schedule(ScheduleResult(self.project, result.result))
+        self._solving_key = None
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import partial
-from typing import override, Any
+from typing import override, Any, Callable
 from datetime import date
 
 from PySide6 import QtCore, QtWidgets, QtGui
@@ -28,6 +28,13 @@ from gui.field import (
 )
 
 
+def row_button(label: str, on_click: Callable[[], None]) -> QtWidgets.QPushButton:
+    button = QtWidgets.QPushButton(label)
+    button.setFixedHeight(40)
+    button.clicked.connect(on_click)
+    return button
+
+
 class TableWidget(QtWidgets.QTableWidget, ABC, metaclass=AbstractQWidgetMeta):
     def __init__(
         self, project: Project, rows: int, buttons: int, col_offset: int = 0
@@ -58,20 +65,21 @@ class TableWidget(QtWidgets.QTableWidget, ABC, metaclass=AbstractQWidgetMeta):
     def sizeHint(self) -> QtCore.QSize:
         return QtCore.QSize(400, 600)
 
-    def setRow(self, index: int, label: str, editable: bool) -> None:
+    def setRow(
+        self, index: int, label: str, editable: bool, deletable: bool = True
+    ) -> None:
         text = QtWidgets.QLabel(label)
         text.setMargin(5)
         text.setWordWrap(True)
         self.setCellWidget(index, self.col_offset, text)
         if editable:
-            edit_button = QtWidgets.QPushButton("Edit")
-            edit_button.setFixedHeight(40)
-            edit_button.clicked.connect(partial(self.edit_clicked, index=index))
+            edit_button = row_button("Edit", partial(self.edit_clicked, index=index))
             self.setCellWidget(index, 1 + self.col_offset, edit_button)
-        delete_button = QtWidgets.QPushButton("Delete")
-        delete_button.setFixedHeight(40)
-        delete_button.clicked.connect(partial(self.delete_clicked, index=index))
-        self.setCellWidget(index, 2 + self.col_offset, delete_button)
+        if deletable:
+            delete_button = row_button(
+                "Delete", partial(self.delete_clicked, index=index)
+            )
+            self.setCellWidget(index, 2 + self.col_offset, delete_button)
 
     @abstractmethod
     def edit_clicked(self, index: int) -> None:
@@ -131,6 +139,7 @@ class AddOrEditWidget(QtWidgets.QWidget, ABC, metaclass=AbstractQWidgetMeta):
         self._layout = QtWidgets.QGridLayout(self)
 
         self.field_widgets: list[Editor] = []
+        self.shown_fields: tuple[Field, ...] = ()
 
     def populate_fields(self) -> None:
         clear_layout(self._layout, start_index=self.prefix_fields)
@@ -139,6 +148,8 @@ class AddOrEditWidget(QtWidgets.QWidget, ABC, metaclass=AbstractQWidgetMeta):
         self.save_button.clicked.connect(self.save_clicked)
 
         fields = self.get_current_fields()
+        # Reused when parsing the editors, rather than regenerating the fields
+        self.shown_fields = fields
         for i, field in enumerate(fields):
             label = QtWidgets.QLabel(field.name)
             self._layout.addWidget(label, self.prefix_fields + i, 0)
@@ -214,10 +225,9 @@ class AddOrEditWidget(QtWidgets.QWidget, ABC, metaclass=AbstractQWidgetMeta):
             raise ValueError(f"Unsupported field type: {type(field)}")
 
     def _rebuild_fields(self) -> tuple[Any, ...]:
-        old_fields = self.get_current_fields()
         return tuple(
             AddOrEditWidget._rebuild_field(old_field, widget)
-            for old_field, widget in zip(old_fields, self.field_widgets)
+            for old_field, widget in zip(self.shown_fields, self.field_widgets)
         )
 
     @override
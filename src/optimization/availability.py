@@ -10,14 +10,13 @@ from optimization.objective import Objective
 
 def _unavailable_days(builder: CallProblemBuilder) -> list[Variable]:
     day_vars = builder.get_day_vars()
-    result: list[Variable] = []
-    for resident in builder.get_residents().values():
-        for day, is_available in enumerate(resident.availability):
-            if is_available == 0:
-                # Resident is unavailable this day
-                result.append(day_vars[resident.name][day])
-
-    return result
+    return [
+        day_var
+        for resident in builder.get_residents().values()
+        for day_var, is_available in zip(day_vars[resident.name], resident.availability)
+        # Resident is unavailable this day
+        if is_available == 0
+    ]
 
 
 class AvailabilityConstraint(Constraint):
@@ -25,6 +25,10 @@ class CallProblemBuilder(ABC):
     def get_residents(self) -> Mapping[str, Resident]:
         pass
 
+    @abstractmethod
+    def get_residents_by_pgy(self) -> Mapping[int, Sequence[str]]:
+        pass
+
     @abstractmethod
     def get_problem(self) -> PulpProblem:
         pass
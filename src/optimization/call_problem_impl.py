@@ -8,13 +8,14 @@ from optimization.call_problem import CallProblemBuilder
 from optimization.solution import Solution, key_for_day
 from optimization.constraint import Constraint, SerializableConstraint
 from optimization.objective import combine_objectives, Objective, SerializableObjective
-from dateutil import days_until_next_weekday, Weekday
+from dateutil import days_until_next_weekday, weekday_indices, Weekday
 from structs.project import Project
 from structs.resident import Resident
 from optimization.linear_problem import (
     PulpProblem,
     Variable,
     VariableLike,
+    var_sum,
 )
 
 
@@ -26,6 +27,10 @@ class CallProblemBuilderImpl(CallProblemBuilder):
     ) -> None:
         self.start_date = project.start_date
         self.residents = {resident.name: resident for resident in project.availability}
+        residents_by_pgy: dict[int, list[str]] = defaultdict(list)
+        for resident in project.availability:
+            residents_by_pgy[resident.pgy].append(resident.name)
+        self.residents_by_pgy = dict(residents_by_pgy)
         self.coverage = project.coverage
 
         self.problem = PulpProblem(
@@ -90,7 +95,7 @@ class CallProblemBuilderImpl(CallProblemBuilder):
                     days_for_resident[day]
                     for days_for_resident in self.day_vars.values()
                 ]
-                self.problem.add_constraint(sum(all_residents_for_day) == 1)
+                self.problem.add_constraint(var_sum(all_residents_for_day) == 1)
 
         # Ensure a resident doesn't work two days in a row
         for days_for_resident in self.day_vars.values():
@@ -102,6 +107,10 @@ class CallProblemBuilderImpl(CallProblemBuilder):
         # Cache of q2s, q3s, etc
         self.qns: dict[int, dict[str, List[Variable]]] = {}
         self.va_vars: list[Variable] | None = None
+        # Saturday/Sunday day indices, the same for every resident
+        self.weekend_indices: (
+            list[tuple[int, int] | tuple[None, int] | tuple[int, None]] | None
+        ) = None
 
     def _vars_for_day_by_pgy(self, day: int) -> Mapping[int, List[Variable]]:
         result = defaultdict(list)
@@ -125,6 +134,10 @@ class CallProblemBuilderImpl(CallProblemBuilder):
     def get_residents(self) -> Mapping[str, Resident]:
         return self.residents
 
+    @override
+    def get_residents_by_pgy(self) -> Mapping[int, Sequence[str]]:
+        return self.residents_by_pgy
+
     @override
     def get_problem(self) -> PulpProblem:
         return self.problem
@@ -142,40 +155,54 @@ class CallProblemBuilderImpl(CallProblemBuilder):
 
     @override
     def get_vars_for_weekday(self, resident: str, weekday: Weekday) -> list[Variable]:
-        day = days_until_next_weekday(self.start_date, weekday)
-        day_vars = []
-        while day < self.num_days:
-            day_vars.append(self.day_vars[resident][day])
-            day += 7
-        return day_vars
+        days_for_resident = self.day_vars[resident]
+        return [
+            days_for_resident[day]
+            for day in weekday_indices(self.start_date, self.num_days, weekday)
+        ]
 
-    @override
-    def get_vars_for_weekends(
-        self, resident: str
-    ) -> list[
-        tuple[Variable, Variable] | tuple[None, Variable] | tuple[Variable, None]
-    ]:
-        result = []
+    def _get_weekend_indices(
+        self,
+    ) -> list[tuple[int, int] | tuple[None, int] | tuple[int, None]]:
+        if self.weekend_indices is not None:
+            return self.weekend_indices
+        self.weekend_indices = []
 
         saturday = days_until_next_weekday(self.start_date, Weekday.SATURDAY)
         sunday = days_until_next_weekday(self.start_date, Weekday.SUNDAY)
-        day_vars = self.day_vars[resident]
         if min(saturday, sunday) + 1 >= self.num_days:
             # No full weekends in call period
-            return []
+            return self.weekend_indices
         elif sunday < saturday:
             # Call period starts on a Sunday
-            result.append((None, day_vars[sunday]))
-            sunday += 7
+            self.weekend_indices.append((None, sunday))
 
-        while saturday < self.num_days:
-            if sunday < self.num_days:
-                result.append((day_vars[saturday], day_vars[sunday]))
+        for saturday in weekday_indices(
+            self.start_date, self.num_days, Weekday.SATURDAY
+        ):
+            if saturday + 1 < self.num_days:
+                self.weekend_indices.append((saturday, saturday + 1))
             else:
-                result.append((day_vars[saturday], None))
-            saturday += 7
-            sunday += 7
+                self.weekend_indices.append((saturday, None))
+
+        return self.weekend_indices
 
+    @override
+    def get_vars_for_weekends(
+        self, resident: str
+    ) -> list[
+        tuple[Variable, Variable] | tuple[None, Variable] | tuple[Variable, None]
+    ]:
+        result = []
+        day_vars = self.day_vars[resident]
+        for weekend in self._get_weekend_indices():
+            match weekend:
+                case None, sunday:
+                    result.append((None, day_vars[sunday]))
+                case saturday, None:
+                    result.append((day_vars[saturday], None))
+                case saturday, sunday:
+                    result.append((day_vars[saturday], day_vars[sunday]))
         return result
 
     @override
@@ -275,8 +302,8 @@ class CallProblemBuilderImpl(CallProblemBuilder):
         objective = combine_objectives(self, objective_hierarchy)
         self.problem.set_objective(objective)
 
-    def solve(self) -> Solution | str:
-        solution = self.problem.solve()
+    def solve(self, threads: int | None = None) -> Solution | str:
+        solution = self.problem.solve(threads)
         if not solution.was_successful():
             return solution.get_status()
 
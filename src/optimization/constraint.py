@@ -1,12 +1,14 @@
 import math
-from typing import override, Any, Generic, TypeVar
+from typing import override, Any, Generic, TypeVar, Mapping
 from abc import ABC, abstractmethod
 from datetime import date
+from itertools import chain
+from types import MappingProxyType
 
 import pulp as pulp
 
 from optimization.call_problem import CallProblemBuilder
-from optimization.linear_problem import var_sum
+from optimization.linear_problem import var_sum, weighted_sum
 from structs.field import (
     Field,
     WeekdayField,
@@ -18,7 +20,16 @@ from structs.field import (
     DateField,
 )
 from structs.project_info import ProjectInfo
-from dateutil import days_until_next_weekday, num_weekdays_in_time_period, Weekday
+from dateutil import weekday_indices, Weekday
+
+
+def _between(
+    expr: pulp.LpAffineExpression, minimum: int, limit: int
+) -> list[pulp.LpConstraint]:
+    if minimum == limit:
+        # A single equality row gives the solver less to presolve than two bounds
+        return [expr == limit]
+    return [expr >= minimum, expr <= limit]
 
 
 class Constraint(ABC):
@@ -409,16 +420,13 @@ class ConstrainWeekdayConstraint(SerializableConstraint):
             pgys = list(self.pgys.keys())
         pgys = set(pgys)
 
+        days = weekday_indices(
+            builder.get_start_date(), builder.get_num_days(), self.weekday
+        )
         constraints: list[pulp.LpConstraint] = []
         for days_for_resident in builder.get_day_vars(pgys).values():
-            day = days_until_next_weekday(builder.get_start_date(), self.weekday)
-            day_vars = []
-            while day < builder.get_num_days():
-                day_vars.append(days_for_resident[day])
-                day += 7
-            together = var_sum(day_vars)
-            constraints.append(together >= self.minimum)
-            constraints.append(together <= self.limit)
+            day_vars = [days_for_resident[day] for day in days]
+            constraints.extend(_between(var_sum(day_vars), self.minimum, self.limit))
         return constraints
 
 
@@ -568,11 +576,12 @@ class SetMinimumForDaysOfWeekForResidentConstraint(SerializableConstraint):
 
     @override
     def get_constraints(self, builder: CallProblemBuilder) -> list[pulp.LpConstraint]:
-        day_varss = [
-            builder.get_vars_for_weekday(self.resident, weekday)
-            for weekday in self.weekdays
-        ]
-        day_vars = [dv for sublist in day_varss for dv in sublist]
+        day_vars = list(
+            chain.from_iterable(
+                builder.get_vars_for_weekday(self.resident, weekday)
+                for weekday in self.weekdays
+            )
+        )
         return [var_sum(day_vars) >= self.minimum]
 
 
@@ -626,23 +635,15 @@ class NoAdjacentWeekendsConstraint(SerializableConstraint):
 
         residents = builder.get_residents().keys()
         for resident in residents:
-            weekend_tuples = builder.get_vars_for_weekends(resident)
-            weekends_worked = []
-            for weekend in weekend_tuples:
-                match weekend:
-                    case None, sunday:
-                        worked = sunday
-                    case saturday, None:
-                        worked = saturday
-                    case saturday, sunday:
-                        worked = saturday + sunday
-                weekends_worked.append(worked)
+            weekend_days = [
+                [day for day in weekend if day is not None]
+                for weekend in builder.get_vars_for_weekends(resident)
+            ]
 
             # For a sliding window of our limit + 1, ensure the total number of weekends worked is within the limit
-            for i in range(len(weekends_worked) - self.num):
-                constraints.append(
-                    var_sum(weekends_worked[i : i + self.num + 1]) <= self.num
-                )
+            for i in range(len(weekend_days) - self.num):
+                window = chain.from_iterable(weekend_days[i : i + self.num + 1])
+                constraints.append(var_sum(list(window)) <= self.num)
 
         return constraints
 
@@ -714,13 +715,11 @@ class ConstrainPGYConstraint(SerializableConstraint):
 
     @override
     def get_constraints(self, builder: CallProblemBuilder) -> list[pulp.LpConstraint]:
+        day_vars = builder.get_day_vars()
         constraints: list[pulp.LpConstraint] = []
-        for resident, days_for_resident in builder.get_day_vars().items():
-            if builder.get_residents()[resident].pgy != self.pgy:
-                continue
-            vs = var_sum(days_for_resident)
-            constraints.append(vs >= self.minimum)
-            constraints.append(vs <= self.limit)
+        for resident in builder.get_residents_by_pgy().get(self.pgy, []):
+            vs = var_sum(day_vars[resident])
+            constraints.extend(_between(vs, self.minimum, self.limit))
         return constraints
 
 
@@ -819,12 +818,10 @@ class DistributeQ2sConstraint(SerializableConstraint):
     def get_constraints(self, builder: CallProblemBuilder) -> list[pulp.LpConstraint]:
         q2s_dict = builder.get_qn_vars(2)
         q2s_per_resident = [var_sum(q2_vars) for q2_vars in q2s_dict.values()]
-        max_q2s = builder.get_problem().max_of(
-            q2s_per_resident, builder.get_num_days(), "max_q2s"
-        )
-        min_q2s = builder.get_problem().min_of(
-            q2s_per_resident, builder.get_num_days(), "min_q2s"
-        )
+        problem = builder.get_problem()
+        num_days = builder.get_num_days()
+        max_q2s = problem.max_of(q2s_per_resident, num_days, "max_q2s")
+        min_q2s = problem.min_of(q2s_per_resident, num_days, "min_q2s")
         return [max_q2s - min_q2s <= self.tolerance]
 
 
@@ -926,8 +923,8 @@ class LimitTotalQ2sConstraint(SerializableConstraint):
     @override
     def get_constraints(self, builder: CallProblemBuilder) -> list[pulp.LpConstraint]:
         q2s_dict = builder.get_qn_vars(2)
-        q2s = [v for vs in q2s_dict.values() for v in vs]
-        return [var_sum(q2s) <= self.limit]
+        q2s = weighted_sum((v, 1) for vs in q2s_dict.values() for v in vs)
+        return [q2s <= self.limit]
 
 
 class LimitPGY23GapConstraint(SerializableConstraint):
@@ -1053,8 +1050,9 @@ class LimitResidentBetweenDatesConstraint(SerializableConstraint):
 
     @override
     def get_constraints(self, builder: CallProblemBuilder) -> list[pulp.LpConstraint]:
-        start_index = (self.start - builder.get_start_date()).days
-        end_index = (self.end - builder.get_start_date()).days
+        start_date = builder.get_start_date()
+        start_index = (self.start - start_date).days
+        end_index = (self.end - start_date).days
         assert start_index >= 0
         assert end_index >= 0
         assert end_index >= start_index
@@ -1063,27 +1061,33 @@ class LimitResidentBetweenDatesConstraint(SerializableConstraint):
         return [var_sum(vs) <= self.limit]
 
 
+# Built once at import rather than per ConstraintRegistry instance
+_CONSTRAINT_MAP: Mapping[str, type[SerializableConstraint]] = MappingProxyType(
+    {
+        c.get_name(): c
+        for c in [
+            DistributeWithinPGYConstraint,
+            DistributeDayOfWeekConstraint,
+            DistributeWeekendsConstraint,
+            ConstrainWeekdayConstraint,
+            LimitWeekdayForResidentConstraint,
+            SetMinimumForDaysOfWeekForResidentConstraint,
+            NoAdjacentWeekendsConstraint,
+            ConstrainPGYConstraint,
+            LimitVACoverageConstraint,
+            DistributeQ2sConstraint,
+            LimitQ2sConstraint,
+            LimitTotalQ2sConstraint,
+            LimitPGY23GapConstraint,
+            LimitResidentBetweenDatesConstraint,
+        ]
+    }
+)
+
+
 class ConstraintRegistry:
     def __init__(self) -> None:
-        self.constraints = {
-            c.get_name(): c
-            for c in [
-                DistributeWithinPGYConstraint,
-                DistributeDayOfWeekConstraint,
-                DistributeWeekendsConstraint,
-                ConstrainWeekdayConstraint,
-                LimitWeekdayForResidentConstraint,
-                SetMinimumForDaysOfWeekForResidentConstraint,
-                NoAdjacentWeekendsConstraint,
-                ConstrainPGYConstraint,
-                LimitVACoverageConstraint,
-                DistributeQ2sConstraint,
-                LimitQ2sConstraint,
-                LimitTotalQ2sConstraint,
-                LimitPGY23GapConstraint,
-                LimitResidentBetweenDatesConstraint,
-            ]
-        }
+        self.constraints = _CONSTRAINT_MAP
 
     def deserialize(self, name: str, data: dict[str, Any]) -> SerializableConstraint:
         return self.constraints[name].deserialize(data)
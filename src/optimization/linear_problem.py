@@ -1,4 +1,4 @@
-from typing import Optional, Mapping, Sequence
+from typing import Optional, Mapping, Sequence, Iterable
 
 import pulp as pulp
 
@@ -92,7 +92,7 @@ class PulpProblem:
         decision_vars = [
             self.new_binary_variable(f"{var_name}_decision_{i}") for i in range(count)
         ]
-        self.add_constraint(sum(decision_vars) == 1)
+        self.add_constraint(var_sum(decision_vars) == 1)
         return decision_vars
 
     def max_of(
@@ -124,11 +124,11 @@ class PulpProblem:
             )
         return min_var
 
-    def solve(self) -> PulpSolution:
+    def solve(self, threads: int | None = None) -> PulpSolution:
         assert self.objective_fn is not None, "No objective function specified"
-        return self._solve_impl()
+        return self._solve_impl(threads)
 
-    def _solve_impl(self) -> PulpSolution:
+    def _solve_impl(self, threads: int | None = None) -> PulpSolution:
         lp_problem = pulp.LpProblem(
             self.name, pulp.LpMinimize if self.minimize else pulp.LpMaximize
         )
@@ -140,12 +140,43 @@ class PulpProblem:
         options = []
         if self.seed is not None:
             options = [f"RandomS {self.seed}"]
-        lp_problem.solve(pulp.PULP_CBC_CMD(msg=False, options=options))
+            # CBC's parallel search is only deterministic in its 100+n mode,
+            # without it a seeded solve can differ between runs
+            if threads is not None:
+                threads += 100
+        lp_problem.solve(pulp.PULP_CBC_CMD(msg=False, options=options, threads=threads))
         return PulpSolution(lp_problem)
 
 
-def var_sum(data: Sequence[Variable]) -> pulp.LpVariable | pulp.LpAffineExpression:
+def var_sum(data: Sequence[VariableLike]) -> pulp.LpAffineExpression:
+    """
+    Sums into a single expression in place. The builtin sum() copies the
+    running expression on every addition, which is quadratic in len(data).
+    """
     assert data != [], "Cannot sum empty list"
-    result = sum(data)
-    assert isinstance(result, (pulp.LpVariable, pulp.LpAffineExpression))
+    return pulp.lpSum(data)
+
+
+def weighted_sum(
+    terms: Iterable[tuple[Variable, int]], constant: int = 0
+) -> pulp.LpAffineExpression:
+    """
+    Builds the expression directly from (variable, coefficient) pairs, with no
+    intermediate expressions. Each variable must appear at most once.
+    """
+    return pulp.LpAffineExpression(terms, constant=constant)
+
+
+def scaled_sum(terms: Iterable[tuple[VariableLike, int]]) -> pulp.LpAffineExpression:
+    """
+    Sums each expression multiplied by its scale, accumulating into a single
+    expression instead of copying the running total at every step.
+    """
+    result = pulp.LpAffineExpression()
+    for expr, scale in terms:
+        if not isinstance(expr, pulp.LpAffineExpression):
+            expr = pulp.LpAffineExpression(expr)
+        result.constant += expr.constant * scale
+        for var, coef in expr.items():
+            result.addterm(var, coef * scale)
     return result
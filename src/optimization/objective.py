@@ -1,10 +1,11 @@
 import math
-from typing import Any, override, TypeVar, Generic, Sequence
+import re
+from typing import Any, override, TypeVar, Generic, Sequence, Mapping
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from pathlib import Path
+from types import MappingProxyType
 
-from optimization.linear_problem import VariableLike
+from optimization.linear_problem import VariableLike, weighted_sum, scaled_sum
 from optimization.call_problem import CallProblemBuilder
 from optimization.metric import SummaryMetric, ResidentMetric, DetailMetric
 from structs.field import (
@@ -111,9 +112,7 @@ class Q2Objective(NoArgSerializableObjective):
     @override
     def get_objective(self, builder: CallProblemBuilder) -> VariableLike:
         q2s_dict = builder.get_qn_vars(2)
-        q2s = sum(v for vs in q2s_dict.values() for v in vs)
-        assert isinstance(q2s, VariableLike)
-        return q2s
+        return weighted_sum((v, 1) for vs in q2s_dict.values() for v in vs)
 
     @override
     def get_max_value(self, builder: CallProblemBuilder) -> int:
@@ -126,6 +125,14 @@ class ChangesFromPreviousSolutionObjective(
     def __init__(self, path: str, data: list[list[str]]) -> None:
         self.path = path
         self.data = data
+        self.file_name = Path(path).name
+        # Precomputed for comparing against each day's assignment. Without
+        # buddy call every day has one resident, so a plain string compare
+        # is enough.
+        self.sorted_data = [tuple(sorted(day)) for day in data]
+        self.flat_data: list[str] | None = None
+        if all(len(day) == 1 for day in data):
+            self.flat_data = [day[0] for day in data]
 
     @staticmethod
     @override
@@ -144,7 +151,7 @@ class ChangesFromPreviousSolutionObjective(
 
     @override
     def description(self) -> str:
-        return f"Minimize changes from the solution in {Path(self.path).name}"
+        return f"Minimize changes from the solution in {self.file_name}"
 
     @classmethod
     @override
@@ -179,19 +186,16 @@ class ChangesFromPreviousSolutionObjective(
 
     @override
     def get_objective(self, builder: CallProblemBuilder) -> VariableLike:
-        previous_result = self.data
-
-        is_changed_vars = []
-        for i, previous in enumerate(previous_result):
-            if len(previous) != 1:
-                raise ValueError(
-                    "Minimizing changes from previous not yet supported for buddy call"
-                )
-            is_changed_vars.append(1 - builder.get_day_vars()[previous[0]][i])
-
-        result = sum(is_changed_vars)
-        assert isinstance(result, VariableLike)
-        return result
+        if self.flat_data is None:
+            raise ValueError(
+                "Minimizing changes from previous not yet supported for buddy call"
+            )
+        # Each day contributes 1 - (previous resident is still assigned that day)
+        day_vars = builder.get_day_vars()
+        return weighted_sum(
+            ((day_vars[previous][i], -1) for i, previous in enumerate(self.flat_data)),
+            constant=len(self.flat_data),
+        )
 
     @override
     def get_max_value(self, builder: CallProblemBuilder) -> int:
@@ -201,14 +205,20 @@ class ChangesFromPreviousSolutionObjective(
     def summary_metric_header(self) -> str:
         return "Changes from previous"
 
+    def _changed_days(self, assignments: Sequence[Sequence[str]]) -> list[bool]:
+        if self.flat_data is not None:
+            return [
+                len(current) != 1 or current[0] != prev
+                for current, prev in zip(assignments, self.flat_data)
+            ]
+        return [
+            tuple(sorted(current)) != prev
+            for current, prev in zip(assignments, self.sorted_data)
+        ]
+
     @override
     def summary_metric(self, assignments: Sequence[Sequence[str]]) -> str:
-        return str(
-            sum(
-                0 if sorted(current) == sorted(prev) else 1
-                for day, (current, prev) in enumerate(zip(assignments, self.data))
-            )
-        )
+        return str(sum(self._changed_days(assignments)))
 
     @override
     def detail_metric_header(self) -> str:
@@ -216,13 +226,13 @@ class ChangesFromPreviousSolutionObjective(
 
     @override
     def detail_metric_tooltip(self) -> str:
-        return f"Resident(s) assigned in {Path(self.path).name}, if different"
+        return f"Resident(s) assigned in {self.file_name}, if different"
 
     @override
     def detail_metric(self, assignments: Sequence[Sequence[str]]) -> list[str]:
         return [
-            "" if sorted(current) == sorted(prev) else ", ".join(prev)
-            for day, (current, prev) in enumerate(zip(assignments, self.data))
+            ", ".join(prev) if changed else ""
+            for changed, prev in zip(self._changed_days(assignments), self.data)
         ]
 
 
@@ -248,18 +258,22 @@ class VACoverageObjective(NoArgSerializableObjective):
 
     @override
     def get_objective(self, builder: CallProblemBuilder) -> VariableLike:
-        va_vars = sum(builder.get_va_vars())
-        assert isinstance(va_vars, VariableLike)
-        return va_vars
+        return weighted_sum((v, 1) for v in builder.get_va_vars())
 
     @override
     def get_max_value(self, builder: CallProblemBuilder) -> int:
         return builder.get_num_days() * builder.get_num_residents()
 
 
+# Matches each "n=score" entry of a serialized weariness map
+_WEARINESS_RE = re.compile(r"(\d+)=(\d+)")
+
+
 class WearinessObjective(SerializableObjective[tuple[DictIntIntField]], ResidentMetric):
     def __init__(self, weariness_map: dict[int, int]) -> None:
         self.weariness_map = weariness_map
+        # Cache of max values, by number of days
+        self.max_values: dict[int, int] = {}
 
     @staticmethod
     @override
@@ -280,14 +294,20 @@ class WearinessObjective(SerializableObjective[tuple[DictIntIntField]], Resident
     def description(self) -> str:
         return WearinessObjective.human_name()
 
+    @staticmethod
+    def _parse_map(map_str: str) -> dict[int, int]:
+        weariness_map: dict[int, int] = {}
+        for entry in map_str.split(","):
+            match = _WEARINESS_RE.fullmatch(entry)
+            if match is None:
+                raise ValueError(f"Invalid weariness map entry: {entry!r}")
+            weariness_map[int(match[1])] = int(match[2])
+        return weariness_map
+
     @classmethod
     @override
     def deserialize(cls, data: dict[str, Any]) -> Objective:
-        weariness_map: dict[int, int] = {}
-        for entry in data["map"].split(","):
-            k, v = entry.split("=")
-            weariness_map[int(k)] = int(v)
-        return WearinessObjective(weariness_map)
+        return WearinessObjective(WearinessObjective._parse_map(data["map"]))
 
     @override
     def serialize(self) -> dict[str, Any]:
@@ -314,18 +334,15 @@ class WearinessObjective(SerializableObjective[tuple[DictIntIntField]], Resident
 
     @override
     def get_objective(self, builder: CallProblemBuilder) -> VariableLike:
-        # resident -> qn -> count of that qn
-        qns_per_resident: dict[str, dict[int, VariableLike]] = defaultdict(dict)
-        for n, incr in self.weariness_map.items():
-            qn_dict = builder.get_qn_vars(n)
-            for resident, qns in qn_dict.items():
-                qns_per_resident[resident][n] = sum(qns)
-
-        weariness_scores: list[VariableLike] = []
-        for resident, qns_by_n in qns_per_resident.items():
-            weariness_scores.append(
-                sum(qns * self.weariness_map[n] for n, qns in qns_by_n.items())
+        qn_dicts = {n: builder.get_qn_vars(n) for n in self.weariness_map}
+        weariness_scores: list[VariableLike] = [
+            weighted_sum(
+                (qn, incr)
+                for n, incr in self.weariness_map.items()
+                for qn in qn_dicts[n][resident]
             )
+            for resident in builder.get_day_vars().keys()
+        ]
 
         max_possible_weariness = self.get_max_value(builder)
         problem = builder.get_problem()
@@ -337,27 +354,17 @@ class WearinessObjective(SerializableObjective[tuple[DictIntIntField]], Resident
 
     @override
     def get_max_value(self, builder: CallProblemBuilder) -> int:
-        return sum(
-            math.ceil(builder.get_num_days() / n) * incr
-            for n, incr in self.weariness_map.items()
-        )
+        num_days = builder.get_num_days()
+        if num_days not in self.max_values:
+            self.max_values[num_days] = sum(
+                math.ceil(num_days / n) * incr for n, incr in self.weariness_map.items()
+            )
+        return self.max_values[num_days]
 
     @override
     def resident_metric_header(self) -> str:
         return "Weariness"
 
-    def _get_qns_per_resident(
-        self, assignments: Sequence[Sequence[str]], n: int
-    ) -> dict[str, int]:
-        all_residents = set([r for rs in assignments for r in rs])
-        result = {resident: 0 for resident in all_residents}
-        for day in range(len(assignments) - n):
-            for resident in set(assignments[day]).intersection(
-                set(assignments[day + n])
-            ):
-                result[resident] += 1
-        return result
-
     @staticmethod
     def _fmt_weariness(score: int, breakdown: dict[int, int]) -> str:
         breakdown_str = ", ".join(
@@ -369,32 +376,40 @@ class WearinessObjective(SerializableObjective[tuple[DictIntIntField]], Resident
 
     @override
     def resident_metric(self, assignments: Sequence[Sequence[str]]) -> dict[str, str]:
-        all_residents = set([r for rs in assignments for r in rs])
-        scores: dict[str, int] = {resident: 0 for resident in all_residents}
-        breakdown: dict[str, dict[int, int]] = {
-            resident: {} for resident in all_residents
-        }
-        for n, incr in self.weariness_map.items():
-            for resident, qns in self._get_qns_per_resident(assignments, n).items():
-                scores[resident] += qns * incr
-                breakdown[resident][n] = qns
-        return {
-            r: WearinessObjective._fmt_weariness(scores[r], breakdown[r])
-            for r in all_residents
-        }
+        # Resident -> bitmask of the days they're on call
+        day_masks: dict[str, int] = {}
+        for day, residents in enumerate(assignments):
+            for resident in residents:
+                day_masks[resident] = day_masks.get(resident, 0) | 1 << day
+
+        result: dict[str, str] = {}
+        for resident, mask in day_masks.items():
+            # Bit i of mask & (mask >> n) is set for a Qn starting on day i
+            breakdown = {
+                n: (mask & (mask >> n)).bit_count() for n in self.weariness_map
+            }
+            score = sum(breakdown[n] * incr for n, incr in self.weariness_map.items())
+            result[resident] = WearinessObjective._fmt_weariness(score, breakdown)
+        return result
+
+
+# Objective name -> class, shared read-only by every ObjectiveRegistry
+_OBJECTIVE_MAP: Mapping[str, type[SerializableObjective]] = MappingProxyType(
+    {
+        o.get_name(): o
+        for o in [
+            Q2Objective,
+            ChangesFromPreviousSolutionObjective,
+            VACoverageObjective,
+            WearinessObjective,
+        ]
+    }
+)
 
 
 class ObjectiveRegistry:
     def __init__(self) -> None:
-        self.objectives = {
-            o.get_name(): o
-            for o in [
-                Q2Objective,
-                ChangesFromPreviousSolutionObjective,
-                VACoverageObjective,
-                WearinessObjective,
-            ]
-        }
+        self.objectives = _OBJECTIVE_MAP
 
     def deserialize(self, name: str, data: dict[str, Any]) -> SerializableObjective:
         return self.objectives[name].deserialize(data)
@@ -410,9 +425,14 @@ def combine_objectives(
     objective's variables are constrained to be integers (not floats).
     """
     assert objectives != [], "At least one objective must be specified"
-    variable = objectives[0].get_objective(builder)
-    for objective in objectives[1:]:
-        variable = variable * (
-            objective.get_max_value(builder) + 1
-        ) + objective.get_objective(builder)
-    return variable
+    if len(objectives) == 1:
+        return objectives[0].get_objective(builder)
+    # Each objective is scaled by the number of values every later one can take
+    scales = [1]
+    for objective in reversed(objectives[1:]):
+        scales.append(scales[-1] * (objective.get_max_value(builder) + 1))
+    scales.reverse()
+    return scaled_sum(
+        (objective.get_objective(builder), scale)
+        for objective, scale in zip(objectives, scales)
+    )
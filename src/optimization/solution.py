@@ -1,14 +1,30 @@
-from typing import Dict, Sequence, Mapping
+import sys
+from typing import Dict, Iterable, Sequence, Mapping
 from datetime import date, timedelta
-from collections import defaultdict
+from collections import Counter
 
-from dateutil import days_until_next_weekday, Weekday
+from dateutil import weekday_indices, Weekday
 from structs.output_mode import OutputMode
 from structs.resident import Resident
 
 
+def day_key_prefix(day: int) -> str:
+    return f"Day_{day}_"
+
+
 def key_for_day(day: int, resident: str) -> str:
-    return f"Day_{day}_{resident}"
+    return day_key_prefix(day) + resident
+
+
+def _mask_of(flags: Iterable[int]) -> int:
+    """
+    Returns a bitmask with bit i set if the ith flag is nonzero.
+    """
+    mask = 0
+    for day, flag in enumerate(flags):
+        if flag:
+            mask |= 1 << day
+    return mask
 
 
 class Solution:
@@ -27,7 +43,26 @@ class Solution:
         self.num_days = num_days
         self.residents = residents
         self.coverage = coverage
-        self.assignments = None
+        self.resident_names = list(residents.keys())
+        # Resident -> bitmask of the days they're assigned, where bit i is set
+        # if they're on call on day i
+        self.day_masks: Dict[str, int] = {}
+        # Same keys as key_for_day, with each day's prefix formatted only once
+        day_prefixes = [day_key_prefix(day) for day in range(num_days)]
+        for resident in self.resident_names:
+            mask = 0
+            for day, prefix in enumerate(day_prefixes):
+                if values[prefix + resident] != 0.0:
+                    mask |= 1 << day
+            self.day_masks[resident] = mask
+        # Cached, these are derived from values which never change
+        self.assignments: list[list[str]] | None = None
+        self.calls: Dict[str, int] | None = None
+        # Qn counts, by n
+        self.qns: dict[int, Dict[str, int]] = {}
+        self.weekday_masks: dict[Weekday, int] = {}
+        # Per day: full weekday name, mm/dd/yyyy, short "Mon 01-05" form
+        self.date_labels: list[tuple[str, str, str]] | None = None
 
     def __getitem__(self, key: str) -> float:
         return self.values[key]
@@ -39,35 +74,56 @@ class Solution:
         if self.assignments is not None:
             return self.assignments
 
-        self.assignments = []
+        self.assignments = [[] for _ in range(self.num_days)]
 
-        for day in range(self.num_days):
-            assigned_residents = [
-                resident
-                for resident in self.residents.keys()
-                if self.values[key_for_day(day, resident)] != 0.0
-            ]
-            assert assigned_residents != [], "No residents assigned to a day"
-            self.assignments.append(assigned_residents)
+        # Only visit the days each resident actually works, lowest bit first.
+        # Residents are visited by name so every day's list comes out sorted.
+        for resident in sorted(self.day_masks.keys()):
+            mask = self.day_masks[resident]
+            while mask:
+                lowest_bit = mask & -mask
+                self.assignments[lowest_bit.bit_length() - 1].append(resident)
+                mask ^= lowest_bit
 
+        assert all(self.assignments), "No residents assigned to a day"
         return self.assignments
 
+    def _weekday_mask(self, weekday: Weekday) -> int:
+        if weekday in self.weekday_masks:
+            return self.weekday_masks[weekday]
+        mask = 0
+        for day in weekday_indices(self.start_date, self.num_days, weekday):
+            mask |= 1 << day
+        self.weekday_masks[weekday] = mask
+        return mask
+
+    def _get_date_labels(self) -> list[tuple[str, str, str]]:
+        if self.date_labels is not None:
+            return self.date_labels
+        self.date_labels = []
+        for day in range(self.num_days):
+            date = self.start_date + timedelta(days=day)
+            self.date_labels.append(
+                (f"{date:%A}", f"{date:%m/%d/%Y}", f"{date:%a %m-%d}")
+            )
+        return self.date_labels
+
     def get_calls_per_resident(self) -> Dict[str, int]:
-        result = {resident: 0 for resident in self.residents.keys()}
-        for assignments in self.get_assignments():
-            for resident in assignments:
-                result[resident] += 1
-        return result
+        if self.calls is None:
+            self.calls = {
+                resident: mask.bit_count() for resident, mask in self.day_masks.items()
+            }
+        return self.calls
 
     def get_qns_per_resident(self, n: int) -> Dict[str, int]:
-        assignments = self.get_assignments()
-        result = {resident: 0 for resident in self.residents.keys()}
-        for day in range(self.num_days - n):
-            for resident in set(assignments[day]).intersection(
-                set(assignments[day + n])
-            ):
-                result[resident] += 1
-        return result
+        if n in self.qns:
+            return self.qns[n]
+        # Bit i of mask & (mask >> n) is set if days i and i + n are both worked
+        self.qns[n] = {
+            resident: (mask & (mask >> n)).bit_count()
+            for resident, mask in self.day_masks.items()
+        }
+        return self.qns[n]
 
     def get_q2_unfairness(self) -> int:
         """
@@ -88,21 +144,19 @@ class Solution:
         return sum(q2s)
 
     def get_calls_taken_by_year(self) -> Dict[int, int]:
-        result = defaultdict(lambda: 0)
-        for assignments in self.get_assignments():
-            for resident in assignments:
-                result[self.residents[resident].pgy] += 1
+        # A Counter reads as 0 for years with no calls, without inserting them
+        result: Counter[int] = Counter()
+        for resident, calls in self.get_calls_per_resident().items():
+            if calls:
+                result[self.residents[resident].pgy] += calls
         return result
 
     def get_count_of_weekday(self, weekday: Weekday) -> Dict[str, int]:
-        assignments = self.get_assignments()
-        result = {resident: 0 for resident in self.residents.keys()}
-        next_day = days_until_next_weekday(self.start_date, weekday)
-        while next_day < self.num_days:
-            for resident in assignments[next_day]:
-                result[resident] += 1
-            next_day += 7
-        return result
+        weekday_mask = self._weekday_mask(weekday)
+        return {
+            resident: (mask & weekday_mask).bit_count()
+            for resident, mask in self.day_masks.items()
+        }
 
     def get_saturdays(self) -> Dict[str, int]:
         return self.get_count_of_weekday(Weekday.SATURDAY)
@@ -111,24 +165,28 @@ class Solution:
         return self.get_count_of_weekday(Weekday.SUNDAY)
 
     def get_va_covered_days(self) -> list[date]:
-        result = []
-        for day, residents in enumerate(self.get_assignments()):
-            va_residents = [
-                resident for resident in residents if self.residents[resident].va[day]
-            ]
-            if va_residents:
-                result.append(self.start_date + timedelta(days=day))
-        return result
+        va_worked = 0
+        for resident, mask in self.day_masks.items():
+            va_worked |= mask & _mask_of(self.residents[resident].va)
+        return [
+            self.start_date + timedelta(days=day)
+            for day in range(self.num_days)
+            if va_worked >> day & 1
+        ]
 
     def get_availability_violations(self) -> dict[int, list[str]]:
+        # Resident -> days they're assigned to despite being unavailable
+        violated_masks = {
+            resident.name: self.day_masks[resident.name]
+            & _mask_of(available == 0 for available in resident.availability)
+            for resident in self.residents.values()
+        }
         # index of day violated -> residents now assigned to that day
         results: dict[int, list[str]] = {}
         for day in range(self.num_days):
+            day_bit = 1 << day
             violated = [
-                resident.name
-                for resident in self.residents.values()
-                if self.values[key_for_day(day, resident.name)] != 0.0
-                and resident.availability[day] == 0
+                resident for resident, mask in violated_masks.items() if mask & day_bit
             ]
             if violated != []:
                 results[day] = violated
@@ -138,49 +196,49 @@ class Solution:
         self,
         mode: OutputMode,
     ) -> None:
+        # Collected and written at once, rather than a print() per line
+        lines: list[str] = []
         if mode == OutputMode.LIST:
-            print(
-                "\n".join(
-                    ",".join(sorted(residents)) for residents in self.get_assignments()
-                )
-            )
+            lines.extend(",".join(residents) for residents in self.get_assignments())
+            sys.stdout.write("".join(f"{line}\n" for line in lines))
             return
 
-        for day, residents in enumerate(self.get_assignments()):
-            date = self.start_date + timedelta(days=day)
+        for day, (residents, (weekday, full_date, short_date)) in enumerate(
+            zip(self.get_assignments(), self._get_date_labels())
+        ):
             cover_msg = self.coverage[day]
             if mode == OutputMode.CSV:
-                print(f"{date:%A},{date:%m/%d/%Y},{'/'.join(residents)},{cover_msg}")
+                lines.append(f"{weekday},{full_date},{'/'.join(residents)},{cover_msg}")
             else:
-                print(f"\t[{day}] {date:%a %m-%d}: {', '.join(residents)}{cover_msg}")
-
-        if mode == OutputMode.CSV:
-            return
+                lines.append(
+                    f"\t[{day}] {short_date}: {', '.join(residents)}{cover_msg}"
+                )
 
-        print("Objective value = ", self.get_objective_value())
-        print("Total Q2 calls = ", self.get_total_q2s())
-        print("Q2 unfairness = ", self.get_q2_unfairness())
-        calls_by_year = self.get_calls_taken_by_year()
-        print(
-            f"Calls taken by PGY2s =  {calls_by_year[2]}  ({calls_by_year[2] / self.num_days * 100:.2f}%)"
-        )
-        print(
-            f"Calls taken by PGY3s =  {calls_by_year[3]}  ({calls_by_year[3] / self.num_days * 100:.2f}%)"
-        )
-        va_covered = self.get_va_covered_days()
-        print(
-            f"VA coverage dates ({len(va_covered)}): ",
-            ", ".join(f"{d:%m/%d/%Y}" for d in va_covered),
-        )
-
-        print("Per resident stats:")
-        calls = self.get_calls_per_resident()
-        saturdays = self.get_saturdays()
-        sundays = self.get_sundays()
-        q2s = self.get_qns_per_resident(2)
-        for resident in self.residents.keys():
-            print(f"\t{resident}")
-            print(f"\t\tCalls = {calls[resident]}")
-            print(f"\t\tSaturdays = {saturdays[resident]}")
-            print(f"\t\tSundays = {sundays[resident]}")
-            print(f"\t\tQ2s = {q2s[resident]}")
+        if mode != OutputMode.CSV:
+            lines.append(f"Objective value =  {self.get_objective_value()}")
+            lines.append(f"Total Q2 calls =  {self.get_total_q2s()}")
+            lines.append(f"Q2 unfairness =  {self.get_q2_unfairness()}")
+            calls_by_year = self.get_calls_taken_by_year()
+            lines.append(
+                f"Calls taken by PGY2s =  {calls_by_year[2]}  ({calls_by_year[2] / self.num_days * 100:.2f}%)"
+            )
+            lines.append(
+                f"Calls taken by PGY3s =  {calls_by_year[3]}  ({calls_by_year[3] / self.num_days * 100:.2f}%)"
+            )
+            va_covered = self.get_va_covered_days()
+            va_dates = ", ".join(f"{d:%m/%d/%Y}" for d in va_covered)
+            lines.append(f"VA coverage dates ({len(va_covered)}):  {va_dates}")
+
+            lines.append("Per resident stats:")
+            calls = self.get_calls_per_resident()
+            saturdays = self.get_saturdays()
+            sundays = self.get_sundays()
+            q2s = self.get_qns_per_resident(2)
+            for resident in self.residents.keys():
+                lines.append(f"\t{resident}")
+                lines.append(f"\t\tCalls = {calls[resident]}")
+                lines.append(f"\t\tSaturdays = {saturdays[resident]}")
+                lines.append(f"\t\tSundays = {sundays[resident]}")
+                lines.append(f"\t\tQ2s = {q2s[resident]}")
+
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
@@ -54,3 +54,20 @@ class ObjectiveTest(TestBase):
         builder.set_objectives([WearinessObjective({2: 100})])
         solution = builder.solve()
         self.assert_solution(solution, "KSB")
+
+    def test_weariness_serialization(self):
+        objective = WearinessObjective({3: 10, 12: 5})
+        restored = WearinessObjective.deserialize(objective.serialize())
+        assert isinstance(restored, WearinessObjective)
+        self.assertEqual(restored.weariness_map, {3: 10, 12: 5})
+
+    def test_weariness_deserialize_malformed(self):
+        for map_str in ["3=1O,4=5", "3=-5,4=2", "3=10,4", ""]:
+            with self.subTest(map_str=map_str):
+                with self.assertRaises(ValueError):
+                    WearinessObjective.deserialize({"map": map_str})
+
+    def test_weariness_metric(self):
+        objective = WearinessObjective({2: 10, 3: 1})
+        metric = objective.resident_metric([["B"], ["K"], ["B"], ["B"]])
+        self.assertEqual(metric, {"B": "11 (1x Q2, 1x Q3)", "K": "0 ()"})
@@ -0,0 +1,79 @@
+from typing import cast
+from datetime import date
+
+from optimization.tests.test_base import TestBase
+from optimization.solution import Solution
+from optimization.objective import Q2Objective
+from dateutil import Weekday
+
+
+class SolutionTest(TestBase):
+    def _solve(self, spec: str, va_spec: str | None = None) -> Solution:
+        builder = self._get_builder(spec, va_spec=va_spec)
+        builder.set_objectives([Q2Objective()])
+        solution = builder.solve()
+        self.assert_solution(solution, spec)
+        return cast(Solution, solution)
+
+    def test_threaded_solve_is_reproducible(self) -> None:
+        spec = "[BSPK]" * 14
+        solutions = []
+        for _ in range(2):
+            builder = self._get_builder(spec)
+            builder.set_objectives([Q2Objective()])
+            solution = builder.solve(threads=4)
+            self.assertIsInstance(solution, Solution)
+            solutions.append(cast(Solution, solution).get_assignments())
+        self.assertEqual(solutions[0], solutions[1])
+
+    def test_calls_per_resident(self) -> None:
+        solution = self._solve("BSPKBSPBKS")
+        self.assertEqual(
+            {"Barnaby": 3, "Sprocket": 3, "Pippin": 2, "Kevin": 2},
+            solution.get_calls_per_resident(),
+        )
+
+    def test_count_of_weekday(self) -> None:
+        # Starts on a Thursday, so days 2 and 9 are Saturdays and day 3 is a
+        # Sunday
+        solution = self._solve("BSPKBSPBKS")
+        self.assertEqual(
+            {"Barnaby": 0, "Sprocket": 1, "Pippin": 1, "Kevin": 0},
+            solution.get_saturdays(),
+        )
+        self.assertEqual(
+            {"Barnaby": 0, "Sprocket": 0, "Pippin": 0, "Kevin": 1},
+            solution.get_sundays(),
+        )
+        self.assertEqual(
+            {"Barnaby": 2, "Sprocket": 0, "Pippin": 0, "Kevin": 0},
+            solution.get_count_of_weekday(Weekday.THURSDAY),
+        )
+
+    def test_qns_per_resident(self) -> None:
+        solution = self._solve("BSPKBSPBKS")
+        self.assertEqual(
+            {"Barnaby": 1, "Sprocket": 0, "Pippin": 0, "Kevin": 0},
+            solution.get_qns_per_resident(3),
+        )
+        self.assertEqual(
+            {"Barnaby": 1, "Sprocket": 2, "Pippin": 1, "Kevin": 0},
+            solution.get_qns_per_resident(4),
+        )
+
+    def test_va_covered_days(self) -> None:
+        solution = self._solve("BSPK", va_spec="BKPB")
+        self.assertEqual(
+            [date(2026, 1, 1), date(2026, 1, 3)], solution.get_va_covered_days()
+        )
+
+    def test_availability_violations(self) -> None:
+        solution = self._solve("BSPK")
+        self.assertEqual({}, solution.get_availability_violations())
+        # Availability edited after solving
+        solution.residents["Pippin"].availability[2] = 0
+        self.assertEqual({2: ["Pippin"]}, solution.get_availability_violations())
+
+    def test_calls_taken_by_year(self) -> None:
+        solution = self._solve("BSPKBSPBKS")
+        self.assertEqual({2: 6, 3: 4}, solution.get_calls_taken_by_year())
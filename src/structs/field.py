@@ -1,5 +1,6 @@
 from typing import Generic, TypeVar, override, Self
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date
 from abc import ABC, abstractmethod
 from enum import IntEnum
@@ -13,20 +14,20 @@ class IntermediateSentinel(IntEnum):
     VAL = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Field(Generic[TVal], ABC):
     value: TVal
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TextInputField(Generic[TVal], Field[TVal]):
     @abstractmethod
     def parse(self, val: str) -> "TextInputField | IntermediateSentinel | None":
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionField(Generic[TVal], Field[TVal]):
     allowed_values: list[TVal]
 
@@ -42,10 +43,11 @@ class OptionField(Generic[TVal], Field[TVal]):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class WeekdayField(OptionField[Weekday]):
     def __init__(self, value: Weekday, name: str) -> None:
-        super().__init__(value, name, [w for w in Weekday])
+        # slots=True rebuilds the class, which breaks zero-argument super()
+        OptionField.__init__(self, value, name, [w for w in Weekday])
 
     @override
     def parse(self, index: int) -> "WeekdayField":
@@ -56,7 +58,7 @@ class WeekdayField(OptionField[Weekday]):
         return [w.human_name() for w in self.allowed_values]
 
 
-@dataclass
+@dataclass(slots=True)
 class WeekdayListField(Field[set[Weekday]]):
     def parse(self, checks: list[bool]) -> "WeekdayListField":
         assert len(checks) == len(Weekday)
@@ -64,27 +66,40 @@ class WeekdayListField(Field[set[Weekday]]):
         return WeekdayListField(checked, self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntField(TextInputField[int]):
     minimum: int | None = None
     maximum: int | None = None
 
     @override
     def parse(self, val: str) -> "IntField | IntermediateSentinel | None":
-        if val == "":
-            return IntermediateSentinel.VAL
-        try:
-            i_val = int(val)
-        except ValueError:
-            return None
-        if self.minimum is not None and i_val < self.minimum:
-            return IntermediateSentinel.VAL
-        if self.maximum is not None and i_val > self.maximum:
-            return IntermediateSentinel.VAL
-        return IntField(i_val, self.name, self.minimum, self.maximum)
-
-
-@dataclass
+        parsed = _parse_int(val, self.minimum, self.maximum)
+        if isinstance(parsed, IntermediateSentinel) or parsed is None:
+            return parsed
+        # A new field each time, the cache only holds the validated value
+        return IntField(parsed, self.name, self.minimum, self.maximum)
+
+
+# Memoized since the editors re-parse on every keystroke, usually with the
+# same handful of values
+@lru_cache(maxsize=64)
+def _parse_int(
+    val: str, minimum: int | None, maximum: int | None
+) -> int | IntermediateSentinel | None:
+    if val == "":
+        return IntermediateSentinel.VAL
+    try:
+        i_val = int(val)
+    except ValueError:
+        return None
+    if minimum is not None and i_val < minimum:
+        return IntermediateSentinel.VAL
+    if maximum is not None and i_val > maximum:
+        return IntermediateSentinel.VAL
+    return i_val
+
+
+@dataclass(slots=True)
 class StringField(TextInputField[str]):
     @override
     def parse(self, val: str) -> "StringField | IntermediateSentinel | None":
@@ -93,19 +108,19 @@ class StringField(TextInputField[str]):
         return StringField(val, self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitedStringField(OptionField[str]):
     @override
     def allowed_value_labels(self) -> list[str]:
         return self.allowed_values
 
 
-@dataclass
+@dataclass(slots=True)
 class FileField(Field[str]):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DictIntIntField(Field[dict[int, int]]):
     key_label: str
     value_label: str
@@ -114,13 +129,13 @@ class DictIntIntField(Field[dict[int, int]]):
         return DictIntIntField(data, self.name, self.key_label, self.value_label)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiCheckField(Field[dict[str, bool]]):
     def parse(self, data: dict[str, bool]) -> "MultiCheckField":
         return MultiCheckField(data, self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class DateField(Field[date]):
     min_date: date
     max_date: date
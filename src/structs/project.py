@@ -8,6 +8,10 @@ from optimization.objective import SerializableObjective, ObjectiveRegistry
 from structs.project_info import ProjectInfo
 from structs.resident import Resident
 
+# Shared by every deserialize call, they're only ever read from
+_CONSTRAINT_REGISTRY = ConstraintRegistry()
+_OBJECTIVE_REGISTRY = ObjectiveRegistry()
+
 
 @dataclass
 class Project(ProjectInfo):
@@ -55,15 +59,13 @@ class Project(ProjectInfo):
 
         seed = int(data["seed"])
 
-        constraint_registry = ConstraintRegistry()
         constraints = [
-            constraint_registry.deserialize(c["name"], c.get("data", {}))
+            _CONSTRAINT_REGISTRY.deserialize(c["name"], c.get("data", {}))
             for c in data["constraints"]
         ]
 
-        objective_registry = ObjectiveRegistry()
         objectives = [
-            objective_registry.deserialize(o["name"], o.get("data", {}))
+            _OBJECTIVE_REGISTRY.deserialize(o["name"], o.get("data", {}))
             for o in data["objectives"]
         ]
 
@@ -81,7 +83,7 @@ class Project(ProjectInfo):
     @staticmethod
     def read_from_file(path: str) -> "Project":
         with open(path, "r") as project_file:
-            project_data = json.loads(project_file.read())
+            project_data = json.load(project_file)
             return Project.deserialize(project_data)
 
     def write_to_file(self, path: str) -> None:
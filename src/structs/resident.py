@@ -1,3 +1,4 @@
+import sys
 from typing import Any, override
 
 
@@ -9,7 +10,9 @@ class Resident:
         availability: list[int],
         va: list[int],
     ) -> None:
-        self.name = name
+        # Interned since names are used as dict keys throughout solving and
+        # reporting
+        self.name = sys.intern(name)
         self.pgy = pgy
         self.availability = availability
         self.va = va